@@ -6,4 +6,5 @@ class ToolsContext:
     role_repository: Any
     self_worker_name: Optional[str]
     agent_work_dir: str
-    is_integration_test: bool 
\ No newline at end of file
+    is_integration_test: bool
+    browser: Optional[Any] = None
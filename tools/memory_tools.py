@@ -6,23 +6,20 @@ This module provides memory functionality for storing and retrieving prioritized
 """
 
 from typing import List, Dict, Tuple, Callable, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import heapq
+import threading
 from logger.log_wrapper import get_logger
 from tools.context import ToolsContext
 
 logger = get_logger("tools:memory", __name__)
 
 
-@dataclass
+@dataclass(order=True, slots=True)
 class MemoryEntry:
-    """A single memory entry with content and priority."""
-    content: str
+    """A single memory entry with priority and content, ordered by priority alone (lower priority = smaller for min heap)."""
     priority: int
-    
-    def __lt__(self, other: 'MemoryEntry') -> bool:
-        """Compare entries by priority (lower priority = smaller for min heap)."""
-        return self.priority < other.priority
+    content: str = field(compare=False)
 
 
 class Memory:
@@ -30,6 +27,7 @@ class Memory:
     Memory storage system that maintains the top 100 memories ordered by priority.
     
     Uses a min-heap to efficiently maintain only the highest priority memories.
+    A lock guards the heap so concurrent tool calls cannot push it past max_size.
     """
     
     def __init__(self, max_size: int = 20):
@@ -41,6 +39,7 @@ class Memory:
         """
         self.max_size = max_size
         self._memories: List[MemoryEntry] = []
+        self._lock = threading.Lock()
         logger.debug(f"Memory initialized with max_size: {max_size}")
     
     def store_memory(self, content: str, priority: int) -> str:
@@ -64,12 +63,11 @@ class Memory:
         
         new_entry = MemoryEntry(content=content, priority=priority)
         
-        if len(self._memories) < self.max_size:
-            heapq.heappush(self._memories, new_entry)
-        else:
-            if priority > self._memories[0].priority:
-                heapq.heapreplace(self._memories, new_entry)
-            else:
+        with self._lock:
+            if len(self._memories) < self.max_size:
+                heapq.heappush(self._memories, new_entry)
+            elif heapq.heappushpop(self._memories, new_entry) is new_entry:
+                # heappushpop hands the new entry straight back when it does not beat the current minimum
                 logger.debug(f"Memory with priority {priority} not stored (below threshold)")
                 return f"Memory not stored (priority {priority} below current minimum)"
         
@@ -83,14 +81,16 @@ class Memory:
         Returns:
             List[Tuple[str, int]]: List of (content, priority) tuples ordered by priority
         """
-        sorted_memories = sorted(self._memories, key=lambda x: x.priority, reverse=True)
+        with self._lock:
+            sorted_memories = sorted(self._memories, key=lambda x: x.priority, reverse=True)
         result = [(entry.content, entry.priority) for entry in sorted_memories]
         logger.debug(f"Retrieved {len(result)} memories")
         return result
     
     def clear(self) -> None:
         """Clear all stored memories."""
-        self._memories.clear()
+        with self._lock:
+            self._memories.clear()
         logger.debug("Cleared all memories")
     
     def get_memory_count(self) -> int:
@@ -81,9 +81,9 @@ def get_tools(tools_context: ToolsContext):
     def _initialize_playwright():
         """Initialize Playwright browser instance"""
         try:
-            if self._playwright is None:
-                self._playwright = sync_playwright().start()
             if self._browser is None:
+                if self._playwright is None:
+                    self._playwright = sync_playwright().start()
                 self._browser = self._playwright.chromium.launch(headless=True)
             if self._context is None:
                 self._context = self._browser.new_context()
@@ -94,24 +94,27 @@ def get_tools(tools_context: ToolsContext):
 
     def _ensure_browser():
         """Ensure browser is initialized"""
-        if not self._playwright or not self._browser or not self._context:
+        if not self._browser or not self._context:
             _initialize_playwright()
     
-    def init(self, agent_work_dir: str):
+    def init(self, agent_work_dir: str, browser: Optional[Browser]):
         self.agent_work_dir = agent_work_dir
         self._playwright = None
-        self._browser = None
+        self._browser = browser
+        # An injected browser belongs to the caller - cleanup then closes only this tool set's context and page
+        self._owns_browser = browser is None
         self._context = None
         self._current_page = None
-        _ensure_setup()
+        if self._owns_browser:
+            _ensure_setup()
     
     self = type("Self", (), {})()
-    init(self, tools_context.agent_work_dir)
+    init(self, tools_context.agent_work_dir, tools_context.browser)
 
-    def playwright_navigate_to_url(url: str) -> str:
-        """Navigate to a URL and return success/error status."""
+    def playwright_navigate_to_url(url: str, wait_until: str = "domcontentloaded") -> str:
+        """Navigate to a URL and return success/error status. Use wait_until="load" or "networkidle" to also wait for subresources."""
         try:
-            if not self._playwright or not self._browser or not self._context:
+            if not self._browser or not self._context:
                 _initialize_playwright()
             if not self._context:
                 return "Error: Browser context not available."
@@ -120,7 +123,7 @@ def get_tools(tools_context: ToolsContext):
                 self._current_page.close()
             
             self._current_page = self._context.new_page()
-            self._current_page.goto(url, timeout=30000)  # 30 second timeout
+            self._current_page.goto(url, timeout=30000, wait_until=wait_until)  # 30 second timeout
             title = self._current_page.title()
             logger.info(f"Successfully navigated to {url}")
             return f"Successfully navigated to {url}. Page title: {title}"
@@ -282,6 +285,8 @@ def get_tools(tools_context: ToolsContext):
             if self._context:
                 self._context.close()
                 self._context = None
+            if not self._owns_browser:
+                return
             if self._browser:
                 self._browser.close()
                 self._browser = None
@@ -289,7 +294,7 @@ def get_tools(tools_context: ToolsContext):
                 self._playwright.stop()
                 self._playwright = None
         except Exception as e:
-            pass  # Ignore cleanup errors
+            logger.error(f"Error cleaning up Playwright resources: {e}")
     
     # Return tool methods as a list
     return [
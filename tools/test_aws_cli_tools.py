@@ -14,19 +14,10 @@ import shutil
 from dotenv import load_dotenv
 from tools.aws_cli_tools import get_tools
 from agent_environment.aws_fargate_agent_environment import AWSFargateAgentEnvironment
-from tools.context import ToolsContext
+from tools.testing_support import make_tools_context
 
 load_dotenv(override=True)
 
-def make_tools_context(tmp_path):
-    return ToolsContext(
-        role_repository=None,
-        self_worker_name=None,
-        agent_work_dir=str(tmp_path),
-        is_integration_test=True
-    )
-
-
 class TestAWSCLIToolsIntegration(unittest.TestCase):
     """Integration tests for AWS CLI tools that require real AWS CLI installation."""
 
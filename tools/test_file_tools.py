@@ -1,57 +1,46 @@
 import unittest
 import os
-import shutil
+import tempfile
 import json
+from typing import Any, Callable, NamedTuple
 from tools.file_tools import get_tools
-from tools.context import ToolsContext
-
-def make_tools_context(tmp_path):
-    return ToolsContext(
-        role_repository=None,
-        self_worker_name=None,
-        agent_work_dir=str(tmp_path),
-        is_integration_test=True
-    )
+from tools.testing_support import make_tools_context
+
+RAM_BACKED_TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+class FileTools(NamedTuple):
+    write_to_file: Callable[..., Any]
+    append_to_file: Callable[..., Any]
+    read_file: Callable[..., Any]
+    list_directory: Callable[..., Any]
+    create_directory: Callable[..., Any]
+    create_file: Callable[..., Any]
+    delete_file: Callable[..., Any]
+    delete_directory: Callable[..., Any]
+    copy_directory: Callable[..., Any]
+    replace_in_file: Callable[..., Any]
+    file_head: Callable[..., Any]
+    file_tail: Callable[..., Any]
+    file_grep: Callable[..., Any]
+    find_files: Callable[..., Any]
+    diff_files: Callable[..., Any]
+    apply_unified_diff: Callable[..., Any]
+    move_file: Callable[..., Any]
+    copy_file: Callable[..., Any]
+    get_file_metadata: Callable[..., Any]
+    file_exists: Callable[..., Any]
+    is_directory: Callable[..., Any]
 
 class TestFileUtils(unittest.TestCase):
     def setUp(self):
-        """Set up a temporary directory for testing."""
-        self.test_dir = "temp_test_dir_for_orcagent"
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
-        os.makedirs(self.test_dir, exist_ok=True)
-        tools = get_tools(make_tools_context(self.test_dir))
-        
-        class Self:
-            def __init__(self, tools):
-                self.write_to_file = tools[0]
-                self.append_to_file = tools[1]
-                self.read_file = tools[2]
-                self.list_directory = tools[3]
-                self.create_directory = tools[4]
-                self.create_file = tools[5]
-                self.delete_file = tools[6]
-                self.delete_directory = tools[7]
-                self.copy_directory = tools[8]
-                self.replace_in_file = tools[9]
-                self.file_head = tools[10]
-                self.file_tail = tools[11]
-                self.file_grep = tools[12]
-                self.find_files = tools[13]
-                self.diff_files = tools[14]
-                self.apply_unified_diff = tools[15]
-                self.move_file = tools[16]
-                self.copy_file = tools[17]
-                self.get_file_metadata = tools[18]
-                self.file_exists = tools[19]
-                self.is_directory = tools[20]
-        
-        self.file_tools = Self(tools)
+        """Set up a temporary directory for testing, RAM-backed where available (falls back to the OS temp dir on macOS/Windows)."""
+        self.temp_dir_context = tempfile.TemporaryDirectory(dir=RAM_BACKED_TEMP_ROOT, prefix="orcagent_file_")
+        self.test_dir = self.temp_dir_context.name
+        self.file_tools = FileTools(*get_tools(make_tools_context(self.test_dir)))
 
     def tearDown(self):
         """Clean up the temporary directory."""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+        self.temp_dir_context.cleanup()
 
     def test_write_and_read_file(self):
         content = "Hello, OrcAgent!"
@@ -110,8 +99,10 @@ class TestFileUtils(unittest.TestCase):
         self.file_tools.create_directory("sub")
         self.file_tools.write_to_file("sub/grep_test2.txt", "another hello")
         result = self.file_tools.file_grep("hello")
-        self.assertIn("grep_test.txt", result)
-        self.assertIn("sub/grep_test2.txt", result)
+        self.assertIsInstance(result, dict)
+        matched_files = result.keys()
+        self.assertIn("grep_test.txt", matched_files)
+        self.assertIn("sub/grep_test2.txt", matched_files)
         self.assertEqual(len(result["grep_test.txt"]), 2)
 
     def test_find_files(self):
@@ -10,92 +10,161 @@ import os
 import shutil
 import tempfile
 import subprocess
+import sys
+from typing import Any, Callable, NamedTuple, Tuple
 from tools.git_tools import get_tools
-from tools.context import ToolsContext
+from tools.testing_support import make_tools_context
 
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER", "main")
+# Resolved once so spawns skip the PATH search
+GIT_EXECUTABLE = shutil.which("git")
+RAM_BACKED_TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+REPO_PREFIX = os.path.abspath(os.path.dirname(__file__)) + os.sep
+EMPTY_REPOSITORY_SCRIPT = " && ".join([
+    "git init --initial-branch=main",
+    "git config user.name 'Test User'",
+    "git config user.email test@example.com",
+])
+SEED_REPOSITORY_SCRIPT = " && ".join([
+    EMPTY_REPOSITORY_SCRIPT,
+    "printf 'Initial content' > test.txt",
+    "git add test.txt",
+    "git commit -m 'Initial commit'",
+])
 
-def make_tools_context(tmp_path):
-    return ToolsContext(
-        role_repository=None,
-        self_worker_name=None,
-        agent_work_dir=str(tmp_path),
-        is_integration_test=True
+
+class GitTools(NamedTuple):
+    git_status: Callable[..., Any]
+    git_add: Callable[..., Any]
+    git_commit: Callable[..., Any]
+    git_push: Callable[..., Any]
+    git_pull: Callable[..., Any]
+    git_fetch: Callable[..., Any]
+    git_branch_list: Callable[..., Any]
+    git_branch_create: Callable[..., Any]
+    git_checkout: Callable[..., Any]
+    git_merge: Callable[..., Any]
+    git_stash: Callable[..., Any]
+    git_log: Callable[..., Any]
+    git_diff: Callable[..., Any]
+    git_reset: Callable[..., Any]
+    git_remote_list: Callable[..., Any]
+    git_remote_add: Callable[..., Any]
+    git_tag_list: Callable[..., Any]
+    git_tag_create: Callable[..., Any]
+    git_clean: Callable[..., Any]
+    git_show: Callable[..., Any]
+    git_stash_pop: Callable[..., Any]
+    git_branch: Callable[..., Any]
+    git_remote: Callable[..., Any]
+
+
+def remove_tree(path: str) -> None:
+    """Remove a directory tree, using the native rm on POSIX as it outpaces shutil.rmtree."""
+    if sys.platform == "win32":
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        subprocess.run(["rm", "-rf", path], check=False)
+
+
+def setUpModule():
+    """Ensure git is available once per test module load - fail if not found."""
+    if GIT_EXECUTABLE is None:
+        raise RuntimeError("Git not found. This is a required prerequisite for integration tests: git is not on PATH")
+    try:
+        subprocess.run([GIT_EXECUTABLE, "--version"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Git not found. This is a required prerequisite for integration tests: {e} {e.stderr.decode().strip()}")
+
+
+def write_file(path: str, content: str, append: bool = False) -> None:
+    """Write a small file in a single unbuffered syscall."""
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    fd = os.open(path, flags, 0o644)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
+
+
+def create_template_repository(script: str) -> str:
+    """Run a repository setup script in a fresh temp directory that tests copy from - fail if this fails."""
+    template_repo_dir = tempfile.mkdtemp(dir=RAM_BACKED_TEMP_ROOT, prefix=f"orcagent_git_template_{XDIST_WORKER}_")
+    try:
+        subprocess.run(script, cwd=template_repo_dir, shell=True, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        remove_tree(template_repo_dir)
+        raise RuntimeError(f"Failed to initialize git repository. Git must be properly configured: {e} {e.stderr.decode().strip()}")
+    return template_repo_dir
+
+
+def clone_template_repository(template_repo_dir: str, destination_dir: str) -> None:
+    """Clone a template sharing its object store, then drop the origin remote so the clone is standalone."""
+    clone_command = [
+        GIT_EXECUTABLE, "clone", "--local", "--shared", "--quiet", "--branch", "main",
+        "--config", "user.name=Test User", "--config", "user.email=test@example.com",
+        template_repo_dir, destination_dir
+    ]
+    subprocess.run(clone_command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    subprocess.run(
+        [GIT_EXECUTABLE, "-C", destination_dir, "remote", "remove", "origin"],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
     )
 
 
+def verify_outside_repository(temp_dir: str) -> None:
+    """Fail if a temp directory is inside the repository; mkdtemp paths are already absolute."""
+    if temp_dir.startswith(REPO_PREFIX):
+        raise RuntimeError(f"Test temp directory {temp_dir} is inside repository {REPO_PREFIX}. This violates isolation requirements.")
+
+
 class TestGitToolsIntegration(unittest.TestCase):
     """Integration tests for Git tools that require real git installation."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build a seed repository that each test clones, a long-lived object reader over it, and the shared tools."""
+        # Class cleanups are registered as each resource is created, so they also run if a later setup step fails
+        cls.template_repo_dir = create_template_repository(SEED_REPOSITORY_SCRIPT)
+        cls.addClassCleanup(remove_tree, cls.template_repo_dir)
+        cls.object_reader = subprocess.Popen(
+            [GIT_EXECUTABLE, "cat-file", "--batch"],
+            cwd=cls.template_repo_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+        cls.addClassCleanup(cls.stop_object_reader)
+        
+        # Create temp directory in RAM-backed or system temp location, outside repository
+        cls.temp_dir = tempfile.mkdtemp(dir=RAM_BACKED_TEMP_ROOT, prefix=f"orcagent_git_test_{XDIST_WORKER}_")
+        cls.addClassCleanup(remove_tree, cls.temp_dir)
+        verify_outside_repository(cls.temp_dir)
+        cls.test_repo_dir = os.path.join(cls.temp_dir, "test_repo")
+        
+        # Git tools bind their work dir at creation, so every test reuses the same repository path
+        cls.git_tools = GitTools(*get_tools(make_tools_context(cls.test_repo_dir)))
+    
+    @classmethod
+    def stop_object_reader(cls):
+        """Close the object reader's input so it exits, then wait for it."""
+        cls.object_reader.stdin.close()
+        cls.object_reader.wait()
+        cls.object_reader.stdout.close()
+    
+    @classmethod
+    def read_seed_object(cls, revision: str) -> Tuple[str, str]:
+        """Resolve a revision in the seed repository to its object id and content, without spawning git."""
+        cls.object_reader.stdin.write(f"{revision}\n".encode())
+        cls.object_reader.stdin.flush()
+        object_id, _, size = cls.object_reader.stdout.readline().decode().split()
+        content = cls.object_reader.stdout.read(int(size) + 1)[:-1]
+        return object_id, content.decode()
+    
     def setUp(self):
-        """Set up a temporary directory and initialize a git repository for testing."""
-        # Create temp directory in system temp location, outside repository
-        self.temp_dir = tempfile.mkdtemp(prefix="orcagent_git_test_")
-        self.test_repo_dir = os.path.join(self.temp_dir, "test_repo")
-        os.makedirs(self.test_repo_dir)
-        
-        # Verify we're outside the repository
-        current_repo_path = os.path.abspath(os.path.dirname(__file__))
-        temp_path = os.path.abspath(self.temp_dir)
-        if temp_path.startswith(current_repo_path):
-            self.fail(f"Test temp directory {temp_path} is inside repository {current_repo_path}. This violates isolation requirements.")
-        
-        # Create git tools instance
-        tools = get_tools(make_tools_context(self.test_repo_dir))
-        
-        class Self:
-            def __init__(self, tools):
-                self.git_status = tools[0]
-                self.git_add = tools[1]
-                self.git_commit = tools[2]
-                self.git_push = tools[3]
-                self.git_pull = tools[4]
-                self.git_fetch = tools[5]
-                self.git_branch_list = tools[6]
-                self.git_branch_create = tools[7]
-                self.git_checkout = tools[8]
-                self.git_merge = tools[9]
-                self.git_stash = tools[10]
-                self.git_log = tools[11]
-                self.git_diff = tools[12]
-                self.git_reset = tools[13]
-                self.git_remote_list = tools[14]
-                self.git_remote_add = tools[15]
-                self.git_tag_list = tools[16]
-                self.git_tag_create = tools[17]
-                self.git_clean = tools[18]
-                self.git_show = tools[19]
-                self.git_stash_pop = tools[20]
-                self.git_branch = tools[21]
-                self.git_remote = tools[22]
-        
-        self.git_tools = Self(tools)
-        
-        # Ensure git is available - fail if not found
-        try:
-            subprocess.run(["git", "--version"], capture_output=True, check=True)
-        except (FileNotFoundError, subprocess.CalledProcessError) as e:
-            self.fail(f"Git not found. This is a required prerequisite for integration tests: {e}")
-        
-        # Initialize a git repository - fail if this fails
-        try:
-            subprocess.run(["git", "init", "--initial-branch=main"], cwd=self.test_repo_dir, check=True, capture_output=True)
-            subprocess.run(["git", "config", "user.name", "Test User"], cwd=self.test_repo_dir, check=True)
-            subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=self.test_repo_dir, check=True)
-            
-            # Create an initial commit
-            test_file = os.path.join(self.test_repo_dir, "test.txt")
-            with open(test_file, 'w') as f:
-                f.write("Initial content")
-            subprocess.run(["git", "add", "test.txt"], cwd=self.test_repo_dir, check=True)
-            subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=self.test_repo_dir, check=True)
-            
-        except (FileNotFoundError, subprocess.CalledProcessError) as e:
-            self.fail(f"Failed to initialize git repository. Git must be properly configured: {e}")
-    
-    def tearDown(self):
-        """Clean up the temporary directory."""
-        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        """Set up a fresh shared clone of the seed git repository at the class's repository path."""
+        # Registered before cloning so a failed setUp cannot leave the path behind for the next test
+        self.addCleanup(remove_tree, self.test_repo_dir)
+        clone_template_repository(self.template_repo_dir, self.test_repo_dir)
     
     def test_git_status_integration(self):
         """Test git status functionality with real git."""
@@ -106,8 +175,7 @@ class TestGitToolsIntegration(unittest.TestCase):
         """Test git add functionality with real git."""
         # Create a new file
         new_file = os.path.join(self.test_repo_dir, "new_file.txt")
-        with open(new_file, 'w') as f:
-            f.write("New content")
+        write_file(new_file, "New content")
         
         result = self.git_tools.git_add("new_file.txt")
         self.assertIn("successful", result.lower())
@@ -121,8 +189,7 @@ class TestGitToolsIntegration(unittest.TestCase):
         # Create multiple new files
         for i in range(3):
             new_file = os.path.join(self.test_repo_dir, f"file_{i}.txt")
-            with open(new_file, 'w') as f:
-                f.write(f"Content {i}")
+            write_file(new_file, f"Content {i}")
         
         result = self.git_tools.git_add(".")
         self.assertIn("successful", result.lower())
@@ -131,8 +198,7 @@ class TestGitToolsIntegration(unittest.TestCase):
         """Test git commit functionality with real git."""
         # Create and add a new file
         new_file = os.path.join(self.test_repo_dir, "commit_test.txt")
-        with open(new_file, 'w') as f:
-            f.write("Commit test content")
+        write_file(new_file, "Commit test content")
         
         self.git_tools.git_add("commit_test.txt")
         
@@ -191,8 +257,7 @@ class TestGitToolsIntegration(unittest.TestCase):
         
         # Create a file on the branch
         merge_file = os.path.join(self.test_repo_dir, "merge_file.txt")
-        with open(merge_file, 'w') as f:
-            f.write("Merge test content")
+        write_file(merge_file, "Merge test content")
         
         self.git_tools.git_add("merge_file.txt")
         self.git_tools.git_commit("Add merge test file")
@@ -206,15 +271,16 @@ class TestGitToolsIntegration(unittest.TestCase):
     
     def test_git_log_integration(self):
         """Test git log functionality with real git."""
+        initial_commit_id, _ = self.read_seed_object("HEAD")
         result = self.git_tools.git_log()
         self.assertIn("Initial commit", result)
+        self.assertTrue(initial_commit_id.startswith(result.split()[0]))
     
     def test_git_diff_integration(self):
         """Test git diff functionality with real git."""
         # Modify a file
         test_file = os.path.join(self.test_repo_dir, "test.txt")
-        with open(test_file, 'a') as f:
-            f.write("\nModified content")
+        write_file(test_file, "\nModified content", append=True)
         
         result = self.git_tools.git_diff()
         self.assertIn("Modified content", result)
@@ -223,8 +289,7 @@ class TestGitToolsIntegration(unittest.TestCase):
         """Test git stash functionality with real git."""
         # Modify a file first
         test_file = os.path.join(self.test_repo_dir, "test.txt")
-        with open(test_file, 'a') as f:
-            f.write("\nStash test content")
+        write_file(test_file, "\nStash test content", append=True)
         
         result = self.git_tools.git_stash()
         self.assertIn("successful", result.lower())
@@ -233,8 +298,7 @@ class TestGitToolsIntegration(unittest.TestCase):
         """Test git stash pop functionality with real git."""
         # Stash something first
         test_file = os.path.join(self.test_repo_dir, "test.txt")
-        with open(test_file, 'a') as f:
-            f.write("\nStash pop test content")
+        write_file(test_file, "\nStash pop test content", append=True)
         
         self.git_tools.git_stash()
         
@@ -246,8 +310,7 @@ class TestGitToolsIntegration(unittest.TestCase):
         """Test git reset functionality with real git."""
         # Create and stage a file
         reset_file = os.path.join(self.test_repo_dir, "reset_test.txt")
-        with open(reset_file, 'w') as f:
-            f.write("Reset test content")
+        write_file(reset_file, "Reset test content")
         
         self.git_tools.git_add("reset_test.txt")
         
@@ -259,8 +322,7 @@ class TestGitToolsIntegration(unittest.TestCase):
         # Create untracked files
         for i in range(2):
             untracked_file = os.path.join(self.test_repo_dir, f"untracked_{i}.txt")
-            with open(untracked_file, 'w') as f:
-                f.write(f"Untracked content {i}")
+            write_file(untracked_file, f"Untracked content {i}")
         
         result = self.git_tools.git_clean()
         self.assertIn("successful", result.lower())
@@ -282,86 +344,72 @@ class TestGitToolsIntegration(unittest.TestCase):
     
     def test_git_show_integration(self):
         """Test git show functionality with real git."""
+        initial_commit_id, _ = self.read_seed_object("HEAD")
         result = self.git_tools.git_show("HEAD")
         self.assertIn("Initial commit", result)
+        self.assertIn(initial_commit_id, result)
 
 
-class TestGitToolsErrorHandlingIntegration(unittest.TestCase):
-    """Integration tests for error handling in git tools."""
+class TestGitToolsNonRepositoryIntegration(unittest.TestCase):
+    """Integration tests for git tools run outside any git repository."""
     
-    def setUp(self):
-        """Set up a temporary directory without git repository."""
-        # Create temp directory in system temp location, outside repository
-        self.temp_dir = tempfile.mkdtemp(prefix="orcagent_git_error_test_")
-        tools = get_tools(make_tools_context(self.temp_dir))
-        
-        class Self:
-            def __init__(self, tools):
-                self.git_status = tools[0]
-                self.git_add = tools[1]
-                self.git_commit = tools[2]
-                self.git_push = tools[3]
-                self.git_pull = tools[4]
-                self.git_fetch = tools[5]
-                self.git_branch_list = tools[6]
-                self.git_branch_create = tools[7]
-                self.git_checkout = tools[8]
-                self.git_merge = tools[9]
-                self.git_stash = tools[10]
-                self.git_log = tools[11]
-                self.git_diff = tools[12]
-                self.git_reset = tools[13]
-                self.git_remote_list = tools[14]
-                self.git_remote_add = tools[15]
-                self.git_tag_list = tools[16]
-                self.git_tag_create = tools[17]
-                self.git_clean = tools[18]
-                self.git_show = tools[19]
-                self.git_stash_pop = tools[20]
-                self.git_branch = tools[21]
-                self.git_remote = tools[22]
-        
-        self.git_tools = Self(tools)
-        
-        # Verify we're outside the repository
-        current_repo_path = os.path.abspath(os.path.dirname(__file__))
-        temp_path = os.path.abspath(self.temp_dir)
-        if temp_path.startswith(current_repo_path):
-            self.fail(f"Test temp directory {temp_path} is inside repository {current_repo_path}. This violates isolation requirements.")
-        
-        # Ensure git is available - fail if not found
-        try:
-            subprocess.run(["git", "--version"], capture_output=True, check=True)
-        except (FileNotFoundError, subprocess.CalledProcessError) as e:
-            self.fail(f"Git not found. This is a required prerequisite for integration tests: {e}")
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared tools over a work directory that is never initialized."""
+        # Create temp directory in RAM-backed or system temp location, outside repository
+        cls.temp_dir = tempfile.mkdtemp(dir=RAM_BACKED_TEMP_ROOT, prefix=f"orcagent_git_non_repo_test_{XDIST_WORKER}_")
+        verify_outside_repository(cls.temp_dir)
+        cls.work_dir = os.path.join(cls.temp_dir, "work")
+        cls.git_tools = GitTools(*get_tools(make_tools_context(cls.work_dir)))
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up the temporary directory."""
-        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        remove_tree(cls.temp_dir)
+    
+    def setUp(self):
+        """Set up a fresh work directory without git repository."""
+        self.addCleanup(remove_tree, self.work_dir)
+        os.mkdir(self.work_dir)
     
     def test_git_status_non_git_directory_integration(self):
         """Test git status in non-git directory with real git."""
         result = self.git_tools.git_status()
         self.assertIn("not a git repository", result.lower())
+
+
+class TestGitToolsErrorHandlingIntegration(unittest.TestCase):
+    """Integration tests for error handling in git tools."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build an initialized but empty repository that each test copies, and the shared tools."""
+        cls.empty_repo_dir = create_template_repository(EMPTY_REPOSITORY_SCRIPT)
+        
+        # Create temp directory in RAM-backed or system temp location, outside repository
+        cls.temp_dir = tempfile.mkdtemp(dir=RAM_BACKED_TEMP_ROOT, prefix=f"orcagent_git_error_test_{XDIST_WORKER}_")
+        verify_outside_repository(cls.temp_dir)
+        cls.work_dir = os.path.join(cls.temp_dir, "work")
+        cls.git_tools = GitTools(*get_tools(make_tools_context(cls.work_dir)))
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the empty repository and temporary directory."""
+        remove_tree(cls.empty_repo_dir)
+        remove_tree(cls.temp_dir)
+    
+    def setUp(self):
+        """Set up a fresh copy of the empty git repository."""
+        self.addCleanup(remove_tree, self.work_dir)
+        shutil.copytree(self.empty_repo_dir, self.work_dir)
     
     def test_git_add_non_existent_file_integration(self):
         """Test git add with non-existent file with real git."""
-        # Initialize git repo first
-        subprocess.run(["git", "init", "--initial-branch=main"], cwd=self.temp_dir, check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=self.temp_dir, check=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=self.temp_dir, check=True)
-        
         result = self.git_tools.git_add("non_existent_file.txt")
         self.assertIn("did not match any files", result.lower())
     
     def test_git_commit_no_changes_integration(self):
         """Test git commit with no changes with real git."""
-        # Initialize git repo first
-        subprocess.run(["git", "init", "--initial-branch=main"], cwd=self.temp_dir, check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], cwd=self.temp_dir, check=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=self.temp_dir, check=True)
-        
         result = self.git_tools.git_commit("Empty commit")
         self.assertIn("nothing to commit", result.lower())
 
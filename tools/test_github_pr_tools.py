@@ -6,58 +6,174 @@ All tests run in isolated system temp directories outside the repository.
 No mocks are used - tests must fail if prerequisites are missing.
 """
 
+import asyncio
+import functools
+import re
 import unittest
 import os
 import tempfile
 import shutil
 import subprocess
+import sys
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
 
 from dotenv import load_dotenv
 from tools.github_pr_tools import get_tools
-from tools.context import ToolsContext
+from tools.testing_support import make_tools_context
 
 load_dotenv(override=True)
 
-def clone_test_repository(test_dir):
-    """Helper function to clone the test repository to the current directory."""
-    github_token = os.getenv("GITHUB_TOKEN")
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER", "main")
+RAM_BACKED_TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+GH_EXECUTABLE = shutil.which("gh")
+REQUIRED_ENVIRONMENT = {var: os.getenv(var) for var in ("GITHUB_TOKEN", "GITHUB_TEST_REPO_NAME", "GITHUB_REPO_OWNER")}
+# Network git calls fail instead of waiting on a credential prompt
+NETWORK_GIT_ENVIRONMENT = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+# Precompiled result patterns - one scan per check, without lowering a copy of large outputs such as diffs
+PR_CREATE_REJECTED_PATTERN = re.compile(r"(?i:no commits between)|must be on a branch named differently")
+NO_COMMITS_PATTERN = re.compile(r"no commits", re.IGNORECASE)
+PR_VIEW_PATTERN = re.compile(r"(?i:no pull request)|#")  # Actual PR data would contain PR number
+PR_STATUS_PATTERN = re.compile(r"Pull Request Status|(?i:no pull request)")
+PR_CHECKS_PATTERN = re.compile(r"no pull request|checks", re.IGNORECASE)
+PR_DIFF_PATTERN = re.compile(r"(?i:no pull request|diff)|@@")  # @@ is the diff hunk marker
+NOT_A_GIT_REPOSITORY_PATTERN = re.compile(r"not a git repository", re.IGNORECASE)
+PR_NOT_FOUND_PATTERN = re.compile(r"could not resolve to a pullrequest", re.IGNORECASE)
+
+
+class GitHubPRTools(NamedTuple):
+    gh_pr_create: Callable[..., Any]
+    gh_pr_list: Callable[..., Any]
+    gh_pr_view: Callable[..., Any]
+    gh_pr_edit: Callable[..., Any]
+    gh_pr_merge: Callable[..., Any]
+    gh_pr_close: Callable[..., Any]
+    gh_pr_reopen: Callable[..., Any]
+    gh_pr_ready: Callable[..., Any]
+    gh_pr_status: Callable[..., Any]
+    gh_pr_checks: Callable[..., Any]
+    gh_pr_comment: Callable[..., Any]
+    gh_pr_diff: Callable[..., Any]
+    gh_pr_checkout: Callable[..., Any]
+
+
+@functools.lru_cache(maxsize=1)
+def get_test_repository_clone_url() -> str:
+    """Build the authenticated clone URL for the test repository once - fail if not configured."""
+    github_token = REQUIRED_ENVIRONMENT["GITHUB_TOKEN"]
     if not github_token:
         raise ValueError("GITHUB_TOKEN environment variable not set for integration tests")
     
-    repo_owner = os.getenv("GITHUB_REPO_OWNER")
-    repo_name = os.getenv("GITHUB_TEST_REPO_NAME")
+    repo_owner = REQUIRED_ENVIRONMENT["GITHUB_REPO_OWNER"]
+    repo_name = REQUIRED_ENVIRONMENT["GITHUB_TEST_REPO_NAME"]
     github_repo = f"{repo_owner}/{repo_name}" if repo_owner and repo_name else None
     if not github_repo:
         raise ValueError("GitHub repository not configured. Check GITHUB_REPO_OWNER and GITHUB_TEST_REPO_NAME environment variables.")
     
-    # Use direct git clone with token for private repository access, clone to current directory
-    clone_url = f"https://{github_token}@github.com/{github_repo}.git"
-    clone_result = subprocess.run(
-        ["git", "clone", clone_url, "."], 
-        cwd=test_dir, 
-        capture_output=True, 
-        text=True
+    # Use token in the URL for private repository access
+    return f"https://{github_token}@github.com/{github_repo}.git"
+
+
+def run_git(args: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> str:
+    """Run a non-interactive git command and return its output - fail with its stderr if it does not succeed."""
+    git_result = subprocess.run(
+        ["git", "-c", "protocol.version=2", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        env=env
     )
-    if clone_result.returncode != 0:
-        raise RuntimeError(f"Failed to clone repository: {clone_result.stderr}")
+    if git_result.returncode != 0:
+        raise RuntimeError(f"Git command {' '.join(args[:2])} failed: {git_result.stderr}")
+    return git_result.stdout
 
 
-def make_tools_context(tmp_path):
-    return ToolsContext(
-        role_repository=None,
-        self_worker_name=None,
-        agent_work_dir=str(tmp_path),
-        is_integration_test=True
-    )
+test_repository_mirrors: List[str] = []
+pending_tree_removals: List[subprocess.Popen] = []
 
 
-class TestGitHubPRToolsIntegration(unittest.TestCase):
-    """Integration tests for GitHub PR tools that require real GitHub CLI."""
+def list_local_branches(repo_dir: str) -> Set[str]:
+    """List the local branch names of a repository."""
+    return set(run_git(["-C", repo_dir, "for-each-ref", "--format=%(refname:short)", "refs/heads"]).split())
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_test_repository_mirror() -> str:
+    """Clone a shallow bare mirror of the test repository once per module run, for the test classes to clone from locally."""
+    clone_url = get_test_repository_clone_url()
+    mirror_dir = tempfile.mkdtemp(dir=RAM_BACKED_TEMP_ROOT, prefix=f"orcagent_gh_pr_mirror_{XDIST_WORKER}_")
+    test_repository_mirrors.append(mirror_dir)
+    # Branch heads only (no refs/pull/*), and no blob filter: a partial mirror cannot serve the local clones made from it
+    run_git(["clone", "--bare", "--depth=1", "--no-single-branch", clone_url, mirror_dir], env=NETWORK_GIT_ENVIRONMENT)
+    run_git(["-C", mirror_dir, "remote", "set-url", "origin", f"https://github.com/{REQUIRED_ENVIRONMENT['GITHUB_REPO_OWNER']}/{REQUIRED_ENVIRONMENT['GITHUB_TEST_REPO_NAME']}.git"])
+    return mirror_dir
+
+
+def clone_test_repository(test_dir):
+    """Helper function to clone the test repository to the current directory from the local mirror."""
+    run_git(["clone", ensure_test_repository_mirror(), "."], cwd=test_dir)
+    # Point origin back at GitHub so gh resolves, and can push to, the real repository
+    run_git(["remote", "set-url", "origin", get_test_repository_clone_url()], cwd=test_dir)
+
+
+def remove_tree_in_background(path: str) -> None:
+    """Remove a temp directory tree off the test's critical path with the native rm on POSIX; tearDownModule waits for it."""
+    if sys.platform == "win32":
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        pending_tree_removals.append(
+            subprocess.Popen(["rm", "-rf", "--", path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        )
+
+
+def tearDownModule():
+    """Remove the test repository mirror and wait for background temp directory removals to finish."""
+    for mirror_dir in test_repository_mirrors:
+        remove_tree_in_background(mirror_dir)
+    for removal in pending_tree_removals:
+        removal.wait()
+
+
+class GitHubPRToolsTestCase(unittest.TestCase):
+    """Shared once-per-class prerequisites, optional template clone, and per-test tools for GitHub PR tests."""
+
+    clone_on_setup = True
+    use_test_repo_subdir = False
+    temp_dir_prefix = "orcagent_gh_pr_test_"
+
+    @classmethod
+    def setUpClass(cls):
+        """Verify prerequisites and clone the test repository once into a pristine template - fail if anything is missing."""
+        # Ensure GitHub CLI is available - fail if not found
+        if GH_EXECUTABLE is None:
+            raise RuntimeError("GitHub CLI not found on PATH. This is a required prerequisite for integration tests")
+        
+        # Ensure required environment variables are set - fail if missing
+        for var, value in REQUIRED_ENVIRONMENT.items():
+            if not value:
+                raise RuntimeError(f"Required environment variable {var} not set for integration tests")
+        
+        # Clone test repository once; each test works in its own linked worktree of it
+        cls.template_dir = None
+        if cls.clone_on_setup:
+            cls.template_dir = tempfile.mkdtemp(dir=RAM_BACKED_TEMP_ROOT, prefix=f"orcagent_gh_pr_template_{XDIST_WORKER}_")
+            try:
+                clone_test_repository(cls.template_dir)
+                cls.template_branches = list_local_branches(cls.template_dir)
+            except Exception:
+                shutil.rmtree(cls.template_dir, ignore_errors=True)
+                raise
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the template repository."""
+        if cls.template_dir:
+            shutil.rmtree(cls.template_dir, ignore_errors=True)
 
     def setUp(self):
         """Set up test fixtures."""
-        # Create temp directory in system temp location, outside repository
-        self.temp_dir = tempfile.mkdtemp(prefix="orcagent_gh_pr_test_")
+        # Create temp directory in RAM-backed temp location where available, outside repository
+        self.temp_dir = tempfile.mkdtemp(dir=RAM_BACKED_TEMP_ROOT, prefix=f"{self.temp_dir_prefix}{XDIST_WORKER}_")
         
         # Verify we're outside the repository
         current_repo_path = os.path.abspath(os.path.dirname(__file__))
@@ -65,49 +181,31 @@ class TestGitHubPRToolsIntegration(unittest.TestCase):
         if temp_path.startswith(current_repo_path):
             self.fail(f"Test temp directory {temp_path} is inside repository {current_repo_path}. This violates isolation requirements.")
         
-        # Ensure GitHub CLI is available - fail if not found
-        try:
-            subprocess.run(["gh", "--version"], capture_output=True, check=True)
-        except (FileNotFoundError, subprocess.CalledProcessError) as e:
-            self.fail(f"GitHub CLI not found. This is a required prerequisite for integration tests: {e}")
-        
-        # Ensure required environment variables are set - fail if missing
-        required_env_vars = ["GITHUB_TOKEN", "GITHUB_TEST_REPO_NAME", "GITHUB_REPO_OWNER"]
-        for var in required_env_vars:
-            if not os.getenv(var):
-                self.fail(f"Required environment variable {var} not set for integration tests")
-        
-        # Clone test repository to the current directory
-        try:
-            clone_test_repository(self.temp_dir)
-        except (ValueError, RuntimeError) as e:
-            self.fail(f"Failed to set up git repository for PR tests: {e}")
+        self.test_repo_dir = os.path.join(self.temp_dir, "test_repo") if self.use_test_repo_subdir else self.temp_dir
+        if self.template_dir:
+            # Objects are shared with the template, so only the working tree is written. A per-test branch
+            # rather than a detached HEAD keeps gh resolving "the current branch's PR" as it does on a clone.
+            worktree_branch = f"orcagent_test_worktree_{os.path.basename(self.temp_dir)}"
+            run_git(["-C", self.template_dir, "worktree", "add", "--quiet", "-b", worktree_branch, self.test_repo_dir])
+        else:
+            os.makedirs(self.test_repo_dir, exist_ok=True)
         
-        tools = get_tools(make_tools_context(self.temp_dir))
-        
-        class Self:
-            def __init__(self, tools):
-                self.gh_pr_create = tools[0]
-                self.gh_pr_list = tools[1]
-                self.gh_pr_view = tools[2]
-                self.gh_pr_edit = tools[3]
-                self.gh_pr_merge = tools[4]
-                self.gh_pr_close = tools[5]
-                self.gh_pr_reopen = tools[6]
-                self.gh_pr_ready = tools[7]
-                self.gh_pr_review = tools[8]
-                self.gh_pr_status = tools[9]
-                self.gh_pr_checks = tools[10]
-                self.gh_pr_comment = tools[11]
-                self.gh_pr_diff = tools[12]
-                self.gh_pr_checkout = tools[13]
-        
-        self.github_pr_tools = Self(tools)
+        self.github_pr_tools = GitHubPRTools(*get_tools(make_tools_context(self.test_repo_dir)))
 
     def tearDown(self):
         """Clean up test fixtures."""
+        if self.template_dir and os.path.exists(self.test_repo_dir):
+            run_git(["-C", self.template_dir, "worktree", "remove", "--force", self.test_repo_dir])
+            # Branches live in the shared template - drop the ones this test created so the next starts pristine
+            created_branches = list_local_branches(self.template_dir) - self.template_branches
+            if created_branches:
+                run_git(["-C", self.template_dir, "branch", "-D", *created_branches])
         if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            remove_tree_in_background(self.temp_dir)
+
+
+class TestGitHubPRToolsIntegration(GitHubPRToolsTestCase):
+    """Integration tests for GitHub PR tools that require real GitHub CLI."""
 
     def test_gh_pr_create_real_integration(self):
         """Test PR creation with real GitHub CLI - integration test."""
@@ -121,17 +219,14 @@ class TestGitHubPRToolsIntegration(unittest.TestCase):
         )
         
         # Should get a safe validation error from our wrapper or the gh CLI
-        self.assertTrue(
-            ("no commits between" in result.lower()) or
-            ("must be on a branch named differently" in result)
-        )
+        self.assertRegex(result, PR_CREATE_REJECTED_PATTERN)
 
     def test_gh_pr_create_creates_head_branch_when_absent(self):
         """Creating a PR with a non-existent head should create the branch locally (even if PR is blocked by no commits)."""
         new_branch = "orcagent_test_branch_does_not_exist"
 
         # Verify branch does not exist before
-        before = subprocess.run(["git", "rev-parse", "--verify", f"refs/heads/{new_branch}"], cwd=self.temp_dir, capture_output=True, text=True)
+        before = subprocess.run(["git", "rev-parse", "--verify", "--quiet", f"refs/heads/{new_branch}"], cwd=self.test_repo_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         self.assertNotEqual(before.returncode, 0)
 
         # Attempt PR create, which should create branch but block due to no commits
@@ -140,111 +235,56 @@ class TestGitHubPRToolsIntegration(unittest.TestCase):
             head=new_branch,
             draft=True
         )
-        self.assertIn("no commits", result.lower())
+        self.assertRegex(result, NO_COMMITS_PATTERN)
 
         # Verify branch now exists locally
-        after = subprocess.run(["git", "rev-parse", "--verify", f"refs/heads/{new_branch}"], cwd=self.temp_dir, capture_output=True, text=True)
+        after = subprocess.run(["git", "rev-parse", "--verify", "--quiet", f"refs/heads/{new_branch}"], cwd=self.test_repo_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         self.assertEqual(after.returncode, 0)
 
-    def test_gh_pr_list_real_integration(self):
-        """Test listing PRs with real GitHub CLI - integration test."""
-        result = self.github_pr_tools.gh_pr_list()
-        
-        # Should succeed with real GitHub CLI in proper git repository
-        self.assertIn("Pull Requests", result)
+    def test_gh_pr_read_queries_real_integration(self):
+        """Test listing, viewing, status, checks, and diff of PRs concurrently with real GitHub CLI - integration test."""
+        read_queries = {
+            # Only the listing header is asserted, so fetch a single PR
+            "gh_pr_list": functools.partial(self.github_pr_tools.gh_pr_list, limit=1),
+            "gh_pr_view": self.github_pr_tools.gh_pr_view,
+            "gh_pr_status": self.github_pr_tools.gh_pr_status,
+            "gh_pr_checks": self.github_pr_tools.gh_pr_checks,
+            "gh_pr_diff": self.github_pr_tools.gh_pr_diff,
+        }
 
-    def test_gh_pr_view_real_integration(self):
-        """Test viewing PR with real GitHub CLI - integration test."""
-        # View current PR or get appropriate no-PR message
-        result = self.github_pr_tools.gh_pr_view()
-        
-        # Should succeed with either PR data or valid no-PR message
-        self.assertTrue(
-            "no pull request" in result.lower() or
-            "#" in result  # Actual PR data would contain PR number
-        )
+        async def run_read_queries():
+            return await asyncio.gather(*[asyncio.to_thread(query) for query in read_queries.values()])
 
-    def test_gh_pr_status_real_integration(self):
-        """Test PR status with real GitHub CLI - integration test."""
-        result = self.github_pr_tools.gh_pr_status()
-        
-        # Should succeed with either status data or valid no-PR message
-        self.assertTrue(
-            "Pull Request Status" in result or
-            "no pull request" in result.lower()
-        )
+        results = dict(zip(read_queries, asyncio.run(run_read_queries())))
 
-    def test_gh_pr_checks_real_integration(self):
-        """Test PR checks with real GitHub CLI - integration test."""
-        result = self.github_pr_tools.gh_pr_checks()
-        
-        # Should succeed with either checks data or valid no-PR message
-        self.assertTrue(
-            "no pull request" in result.lower() or
-            "checks" in result.lower()
-        )
+        with self.subTest(tool="gh_pr_list"):
+            # Should succeed with real GitHub CLI in proper git repository
+            self.assertIn("Pull Requests", results["gh_pr_list"])
 
-    def test_gh_pr_diff_real_integration(self):
-        """Test PR diff with real GitHub CLI - integration test."""
-        result = self.github_pr_tools.gh_pr_diff()
-        
-        # Should succeed with either diff data or valid no-PR message
-        self.assertTrue(
-            "no pull request" in result.lower() or
-            "diff" in result.lower() or
-            "@@" in result  # Diff format marker
-        )
+        with self.subTest(tool="gh_pr_view"):
+            # Should succeed with either PR data or valid no-PR message
+            self.assertRegex(results["gh_pr_view"], PR_VIEW_PATTERN)
 
+        with self.subTest(tool="gh_pr_status"):
+            # Should succeed with either status data or valid no-PR message
+            self.assertRegex(results["gh_pr_status"], PR_STATUS_PATTERN)
 
-class TestGitHubPRToolsErrorHandlingIntegration(unittest.TestCase):
-    """Integration tests for error handling in GitHub PR tools."""
+        with self.subTest(tool="gh_pr_checks"):
+            # Should succeed with either checks data or valid no-PR message
+            self.assertRegex(results["gh_pr_checks"], PR_CHECKS_PATTERN)
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temp directory in system temp location, outside repository
-        self.temp_dir = tempfile.mkdtemp(prefix="orcagent_gh_pr_error_test_")
-        
-        # Verify we're outside the repository
-        current_repo_path = os.path.abspath(os.path.dirname(__file__))
-        temp_path = os.path.abspath(self.temp_dir)
-        if temp_path.startswith(current_repo_path):
-            self.fail(f"Test temp directory {temp_path} is inside repository {current_repo_path}. This violates isolation requirements.")
-        
-        self.test_repo_dir = os.path.join(self.temp_dir, "test_repo")
-        os.makedirs(self.test_repo_dir)
-        
-        # Ensure GitHub CLI is available - fail if not found
-        try:
-            subprocess.run(["gh", "--version"], capture_output=True, check=True)
-        except (FileNotFoundError, subprocess.CalledProcessError) as e:
-            self.fail(f"GitHub CLI not found. This is a required prerequisite for integration tests: {e}")
-        
-        # Create GitHub PR tools instance in non-git directory for error testing
-        tools = get_tools(make_tools_context(self.test_repo_dir))
-        
-        class Self:
-            def __init__(self, tools):
-                self.gh_pr_create = tools[0]
-                self.gh_pr_list = tools[1]
-                self.gh_pr_view = tools[2]
-                self.gh_pr_edit = tools[3]
-                self.gh_pr_merge = tools[4]
-                self.gh_pr_close = tools[5]
-                self.gh_pr_reopen = tools[6]
-                self.gh_pr_ready = tools[7]
-                self.gh_pr_review = tools[8]
-                self.gh_pr_status = tools[9]
-                self.gh_pr_checks = tools[10]
-                self.gh_pr_comment = tools[11]
-                self.gh_pr_diff = tools[12]
-                self.gh_pr_checkout = tools[13]
-        
-        self.github_pr_tools = Self(tools)
+        with self.subTest(tool="gh_pr_diff"):
+            # Should succeed with either diff data or valid no-PR message
+            self.assertRegex(results["gh_pr_diff"], PR_DIFF_PATTERN)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+class TestGitHubPRToolsErrorHandlingIntegration(GitHubPRToolsTestCase):
+    """Integration tests for error handling in GitHub PR tools."""
+
+    # Tools run in a non-git directory unless a test clones into it
+    clone_on_setup = False
+    use_test_repo_subdir = True
+    temp_dir_prefix = "orcagent_gh_pr_error_test_"
 
     def test_gh_pr_create_without_git_repo_integration(self):
         """Test PR creation without git repository - should fail appropriately."""
@@ -255,7 +295,7 @@ class TestGitHubPRToolsErrorHandlingIntegration(unittest.TestCase):
         )
         
         # Should fail specifically with git repository error
-        self.assertIn("not a git repository", result.lower())
+        self.assertRegex(result, NOT_A_GIT_REPOSITORY_PATTERN)
 
     def test_gh_pr_invalid_operation_integration(self):
         """Test invalid PR operations with real GitHub CLI."""
@@ -269,7 +309,7 @@ class TestGitHubPRToolsErrorHandlingIntegration(unittest.TestCase):
         result = self.github_pr_tools.gh_pr_view("99999")
         
         # Should get specific error for non-existent PR
-        self.assertIn("could not resolve to a pullrequest", result.lower())
+        self.assertRegex(result, PR_NOT_FOUND_PATTERN)
 
     def test_gh_comment_empty_body_integration(self):
         """Test commenting with empty body - should fail appropriately."""
@@ -286,61 +326,12 @@ class TestGitHubPRToolsErrorHandlingIntegration(unittest.TestCase):
         self.assertIn("Invalid merge method", result)
 
 
-class TestGitHubPRToolsWorkflowIntegration(unittest.TestCase):
+class TestGitHubPRToolsWorkflowIntegration(GitHubPRToolsTestCase):
     """Integration tests for complete GitHub PR workflows."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temp directory in system temp location, outside repository
-        self.temp_dir = tempfile.mkdtemp(prefix="orcagent_gh_pr_workflow_test_")
-        
-        # Verify we're outside the repository
-        current_repo_path = os.path.abspath(os.path.dirname(__file__))
-        temp_path = os.path.abspath(self.temp_dir)
-        if temp_path.startswith(current_repo_path):
-            self.fail(f"Test temp directory {temp_path} is inside repository {current_repo_path}. This violates isolation requirements.")
-        
-        self.test_repo_dir = os.path.join(self.temp_dir, "test_repo")
-        os.makedirs(self.test_repo_dir)
-        
-        # Ensure GitHub CLI is available - fail if not found
-        try:
-            subprocess.run(["gh", "--version"], capture_output=True, check=True)
-        except (FileNotFoundError, subprocess.CalledProcessError) as e:
-            self.fail(f"GitHub CLI not found. This is a required prerequisite for integration tests: {e}")
-        
-        # Ensure required environment variables - fail if missing
-        required_env_vars = ["GITHUB_TOKEN", "GITHUB_TEST_REPO_NAME", "GITHUB_REPO_OWNER"]
-        for var in required_env_vars:
-            if not os.getenv(var):
-                self.fail(f"Required environment variable {var} not set for integration tests")
-        
-        # Create GitHub PR tools instance
-        tools = get_tools(make_tools_context(self.test_repo_dir))
-        
-        class Self:
-            def __init__(self, tools):
-                self.gh_pr_create = tools[0]
-                self.gh_pr_list = tools[1]
-                self.gh_pr_view = tools[2]
-                self.gh_pr_edit = tools[3]
-                self.gh_pr_merge = tools[4]
-                self.gh_pr_close = tools[5]
-                self.gh_pr_reopen = tools[6]
-                self.gh_pr_ready = tools[7]
-                self.gh_pr_review = tools[8]
-                self.gh_pr_status = tools[9]
-                self.gh_pr_checks = tools[10]
-                self.gh_pr_comment = tools[11]
-                self.gh_pr_diff = tools[12]
-                self.gh_pr_checkout = tools[13]
-        
-        self.github_pr_tools = Self(tools)
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+    clone_on_setup = False
+    use_test_repo_subdir = True
+    temp_dir_prefix = "orcagent_gh_pr_workflow_test_"
 
     def test_gh_authentication_integration(self):
         """Test GitHub CLI authentication - integration test."""
@@ -384,7 +375,7 @@ class TestGitHubPRToolsWorkflowIntegration(unittest.TestCase):
             self.fail(f"Failed to set up git repository for PR list test: {e}")
         
         # Make real call to list PRs
-        result = self.github_pr_tools.gh_pr_list()
+        result = self.github_pr_tools.gh_pr_list(limit=1)
         
         # Should succeed with real GitHub response
         self.assertIn("Pull Requests", result)
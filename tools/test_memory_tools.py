@@ -3,7 +3,10 @@
 Test module for memory tools.
 """
 
+import os
+import random
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 import shutil
 from tools.memory_tools import Memory, MemoryEntry, get_tools
@@ -12,20 +15,23 @@ from agents.role_repository import RoleRepository
 from agents.entities.role import Role
 from agents.entities.worker import Worker
 
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER", "main")
+RAM_BACKED_TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
 class TestMemoryEntry(unittest.TestCase):
     """Test suite for MemoryEntry class."""
     
     def test_memory_entry_creation(self):
         """Test creation of MemoryEntry."""
-        entry = MemoryEntry("test content", 5)
+        entry = MemoryEntry(priority=5, content="test content")
         self.assertEqual(entry.content, "test content")
         self.assertEqual(entry.priority, 5)
     
     def test_memory_entry_comparison(self):
         """Test comparison of MemoryEntry objects (for heap ordering)."""
-        entry1 = MemoryEntry("low priority", 1)
-        entry2 = MemoryEntry("high priority", 10)
+        entry1 = MemoryEntry(priority=1, content="low priority")
+        entry2 = MemoryEntry(priority=10, content="high priority")
         
         # Lower priority should be "less than" for min heap behavior
         self.assertTrue(entry1 < entry2)
@@ -75,13 +81,8 @@ class TestMemory(unittest.TestCase):
         self.memory.store_memory("High priority", 10)
         self.memory.store_memory("Medium priority", 5)
         
-        memories = self.memory.get_memories()
-        self.assertEqual(len(memories), 3)
-        
         # Should be ordered by priority (highest first)
-        self.assertEqual(memories[0][1], 10)  # High priority
-        self.assertEqual(memories[1][1], 5)   # Medium priority
-        self.assertEqual(memories[2][1], 1)   # Low priority
+        self.assertEqual(tuple(priority for _, priority in self.memory.get_memories()), (10, 5, 1))
     
     def test_memory_max_size_enforcement(self):
         """Test that memory enforces max size limit."""
@@ -114,6 +115,17 @@ class TestMemory(unittest.TestCase):
         self.assertIn("below current minimum", result)
         self.assertEqual(self.memory.get_memory_count(), 3)
     
+    def test_memory_retains_top_priorities_at_scale(self):
+        """Test that a full memory keeps exactly the highest priorities across many inserts."""
+        memory = Memory(max_size=100)
+        priorities = list(range(10_000))
+        random.Random(0).shuffle(priorities)
+        for priority in priorities:
+            memory.store_memory(f"Memory {priority}", priority)
+        
+        self.assertEqual(memory.get_memory_count(), 100)
+        self.assertEqual([mem[1] for mem in memory.get_memories()], list(range(9_999, 9_899, -1)))
+    
     def test_memory_clear(self):
         """Test clearing all memories."""
         self.memory.store_memory("Test memory", 5)
@@ -127,39 +139,40 @@ class TestMemory(unittest.TestCase):
 class TestMemoryTools(unittest.TestCase):
     """Test suite for memory tools integration."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up the role repository, worker, and memory tools once for the class."""
+        cls.temp_dir = tempfile.mkdtemp(dir=RAM_BACKED_TEMP_ROOT, prefix=f"orcagent_memory_test_{XDIST_WORKER}_")
         # Set up a minimal role repository and worker for memory tools
-        self.role_repository = RoleRepository()
-        self.role_repository.initialize(
-            run_dir=self.temp_dir,
+        cls.role_repository = RoleRepository()
+        cls.role_repository.initialize(
+            run_dir=cls.temp_dir,
             config_list=[{"model": "test-model"}],
             is_integration_test=True
         )
         # Use unique names to avoid collisions
-        self.role_name = f"test_memory_role_{id(self)}"
-        self.worker_name = f"{self.role_name}_1"
+        cls.role_name = f"test_memory_role_{id(cls)}"
+        cls.worker_name = f"{cls.role_name}_1"
         role = Role(
-            role_name=self.role_name,
+            role_name=cls.role_name,
             base_instructions="You are a memory test role.",
             description="Role for memory tools integration test.",
             role_version=1,
             tool_group_names=[]
         )
-        self.role_repository.register_role(role)
-        worker = Worker(role=role, worker_id=1)
-        worker.initialize_runtime_config(
-            run_dir=self.temp_dir,
+        cls.role_repository.register_role(role)
+        cls.worker = Worker(role=role, worker_id=1)
+        cls.worker.initialize_runtime_config(
+            run_dir=cls.temp_dir,
             config_list=[{"model": "test-model"}],
             is_integration_test=True,
-            role_repository=self.role_repository
+            role_repository=cls.role_repository
         )
-        self.role_repository.register_worker(worker)
+        cls.role_repository.register_worker(cls.worker)
         tools_context = ToolsContext(
-            role_repository=self.role_repository,
-            self_worker_name=self.worker_name,
-            agent_work_dir=self.temp_dir,
+            role_repository=cls.role_repository,
+            self_worker_name=cls.worker_name,
+            agent_work_dir=cls.temp_dir,
             is_integration_test=True
         )
         tools = get_tools(tools_context)
@@ -167,14 +180,19 @@ class TestMemoryTools(unittest.TestCase):
             def __init__(self, tools):
                 self.store_memory = tools[0]
                 self.get_memories = tools[1]
-        self.memory_tools = Self(tools)
+        cls.memory_tools = Self(tools)
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
         # Reset the RoleRepository singleton for isolation
-        if hasattr(self.role_repository, 'reset_singleton'):
-            self.role_repository.reset_singleton()
+        if hasattr(cls.role_repository, 'reset_singleton'):
+            cls.role_repository.reset_singleton()
+    
+    def setUp(self):
+        """Start each test with an empty memory on the shared worker."""
+        self.worker.memory.clear()
     
     def test_store_and_get_memories_tools(self):
         """Test store_memory and get_memories tool functions."""
@@ -187,14 +205,8 @@ class TestMemoryTools(unittest.TestCase):
         self.assertIn("Successfully stored", result2)
         self.assertIn("Successfully stored", result3)
         
-        # Get memories
-        memories = self.memory_tools.get_memories()
-        self.assertEqual(len(memories), 3)
-        
-        # Verify ordering (highest priority first)
-        self.assertEqual(memories[0][1], 10)  # Important deadline
-        self.assertEqual(memories[1][1], 5)   # First task
-        self.assertEqual(memories[2][1], 1)   # Low priority note
+        # Verify ordering (highest priority first): important deadline, first task, low priority note
+        self.assertEqual(tuple(priority for _, priority in self.memory_tools.get_memories()), (10, 5, 1))
     
     def test_memory_tools_error_handling(self):
         """Test error handling in memory tools."""
@@ -206,17 +218,16 @@ class TestMemoryTools(unittest.TestCase):
         self.assertEqual(memories, [])
     
     def test_memory_tools_capacity_management(self):
-        """Test that memory tools properly manage capacity."""
-        # Store many memories to test capacity management
-        for i in range(150):  # More than default capacity of 100
-            self.memory_tools.store_memory(f"Memory {i}", i)
+        """Test that memory tools keep exactly the highest priority memories once over capacity, even when stored concurrently."""
+        capacity = self.worker.memory.max_size
+        # Store many more distinct, unordered priorities than the worker's memory can hold, from several threads at once
+        priorities = random.Random(0).sample(range(10_000), 200)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda priority: self.memory_tools.store_memory(f"Memory {priority}", priority), priorities))
         
+        self.assertLessEqual(self.worker.memory.get_memory_count(), capacity)
         memories = self.memory_tools.get_memories()
-        self.assertLessEqual(len(memories), 100)  # Should not exceed capacity
-        
-        # Should keep highest priority memories
-        if memories:
-            self.assertGreaterEqual(memories[0][1], 50)  # High priority should be retained
+        self.assertEqual([mem[1] for mem in memories], sorted(priorities, reverse=True)[:capacity])
 
 
 if __name__ == '__main__':
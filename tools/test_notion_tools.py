@@ -2,232 +2,216 @@
 Integration Tests for Notion Tools
 
 Integration tests that require real Notion API access and fail if prerequisites are missing.
+Each class works on its own uniquely titled pages, so the module can run across pytest-xdist workers.
 """
 
-import unittest
 import os
-from datetime import datetime
+import uuid
+import pytest
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple
+from notion_client import Client
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tools.notion_tools import get_tools
 from dotenv import load_dotenv
-from tools.context import ToolsContext
+from tools.testing_support import make_tools_context
 
 load_dotenv(override=True)
 
-def make_tools_context():
-    return ToolsContext(
-        role_repository=None,
-        self_worker_name=None,
-        agent_work_dir="/tmp",
-        is_integration_test=True
-    )
-
-class TestNotionToolsIntegration(unittest.TestCase):
+REQUIRED_ENVIRONMENT = {var: os.getenv(var) for var in ("NOTION_API_KEY", "NOTION_TEST_PAGE_ID")}
+NOTION_API_URL = "https://api.notion.com/v1"
+# One pooled keep-alive session for the direct API calls, so each call skips a fresh TCP and TLS handshake
+NOTION_SESSION = requests.Session()
+NOTION_SESSION.headers.update({
+    "Authorization": f"Bearer {REQUIRED_ENVIRONMENT['NOTION_API_KEY']}",
+    "Content-Type": "application/json",
+    "Notion-Version": "2022-06-28"
+})
+NOTION_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    # Archiving is idempotent, so PATCH is retried alongside GET on rate limits and transient server errors
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=frozenset({"GET", "PATCH"}))
+))
+
+class NotionTools(NamedTuple):
+    create_page: Callable[..., Any]
+    get_page: Callable[..., Any]
+    update_page_properties: Callable[..., Any]
+    append_paragraph_to_page: Callable[..., Any]
+    append_block_children: Callable[..., Any]
+    get_block_children: Callable[..., Any]
+    create_database: Callable[..., Any]
+    get_database: Callable[..., Any]
+    update_database_schema: Callable[..., Any]
+    query_database: Callable[..., Any]
+    get_page_content: Callable[..., Any]
+    search_pages: Callable[..., Any]
+    update_page_title: Callable[..., Any]
+    resolve_page_id: Callable[..., Any]
+
+def unique_suffix():
+    """Return a short random suffix that keeps test titles and content unique across parallel workers."""
+    return uuid.uuid4().hex[:12]
+
+def archive_pages(page_ids):
+    """Archive pages concurrently, three at a time to stay near Notion's average rate limit - ignore errors during cleanup."""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        for page_id in page_ids:
+            executor.submit(NOTION_SESSION.patch, f"{NOTION_API_URL}/pages/{page_id}", json={"archived": True})
+
+@pytest.fixture(scope="class")
+def pages_to_archive():
+    """Collect the pages created by a class's tests and archive them together once the class has finished."""
+    page_ids = []
+    yield page_ids
+    archive_pages(page_ids)
+
+@pytest.fixture(scope="session")
+def notion_tools():
+    """Check the prerequisites and create the Notion tools once per session - fail if either is missing."""
+    # Ensure required environment variables are set - fail if missing
+    for var, value in REQUIRED_ENVIRONMENT.items():
+        if not value:
+            pytest.fail(f"Required environment variable {var} not set for integration tests")
+    
+    try:
+        return NotionTools(*get_tools(make_tools_context("/tmp")))
+    except Exception as e:
+        pytest.fail(f"Failed to initialize NotionTools. This is a required prerequisite: {e}")
+
+class TestNotionToolsIntegration:
     """Integration tests for Notion tools that require real Notion API access."""
 
-
-    def setUp(self):
-        """Set up test environment."""
-        # Ensure required environment variables are set - fail if missing
-        required_env_vars = ["NOTION_API_KEY", "NOTION_TEST_PAGE_ID"]
-        for var in required_env_vars:
-            if not os.getenv(var):
-                self.fail(f"Required environment variable {var} not set for integration tests")
-        
-        self.notion_headers = {
-            "Authorization": f"Bearer {os.getenv('NOTION_API_KEY')}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28"
-        }
-        self.notion_base_url = "https://api.notion.com/v1"
-
-        # Create Notion tools instance - fail if initialization fails
-        try:
-            tools = get_tools(make_tools_context())
-
-            class Self:
-                def __init__(self, tools):
-                    self.create_page = tools[0]
-                    self.get_page = tools[1]
-                    self.update_page_properties = tools[2]
-                    self.append_paragraph_to_page = tools[3]
-                    self.append_block_children = tools[4]
-                    self.get_block_children = tools[5]
-                    self.create_database = tools[6]
-                    self.get_database = tools[7]
-                    self.update_database_schema = tools[8]
-                    self.query_database = tools[9]
-                    self.get_page_content = tools[10]
-                    self.search_pages = tools[11]
-                    self.update_page_title = tools[12]
-                    self.resolve_page_id = tools[13]
-
-            self.notion_tools = Self(tools)            
-        except Exception as e:
-            self.fail(f"Failed to initialize NotionTools. This is a required prerequisite: {e}")
+    @pytest.fixture(scope="class", autouse=True)
+    def notion_test_page(self, request, notion_tools, pages_to_archive):
+        """Set up test environment and one test page shared by the class's tests, which only read or add to it."""
+        request.cls.notion_tools = notion_tools
         
         # Create a test page for operations
-        self.test_page_title = f"Test Page - {datetime.now()}"
-        created_page = self.notion_tools.create_page(
-            title=self.test_page_title,
+        request.cls.test_page_title = f"Test Page - {unique_suffix()}"
+        created_page = notion_tools.create_page(
+            title=request.cls.test_page_title,
             content="This is a test page for integration tests."
         )
         
         if not isinstance(created_page, dict) or "id" not in created_page:
-            self.fail(f"Failed to create test page for integration tests: {created_page}")
-        
-        self.test_page_id = created_page["id"]
-
-    def tearDown(self):
-        """Clean up test page."""
-        if hasattr(self, 'test_page_id') and self.test_page_id:
-            # Archive the test page - ignore errors during cleanup
-            try:
-                import requests
-                requests.patch(
-                    f"{self.notion_base_url}/pages/{self.test_page_id}",
-                    headers=self.notion_headers,
-                    json={"archived": True}
-                )
-            except:
-                pass
-
-    def test_create_page_real_integration(self):
+            pytest.fail(f"Failed to create test page for integration tests: {created_page}")
+        
+        request.cls.test_page_id = created_page["id"]
+        pages_to_archive.append(created_page["id"])
+
+    @pytest.fixture(scope="class")
+    def independent_operation_results(self, request, pages_to_archive):
+        """Issue the class's independent create, append, read and search calls concurrently once per class - three at a time for Notion's rate limit."""
+        tools = request.cls.notion_tools
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                "create_page": executor.submit(
+                    tools.create_page,
+                    title="Integration Test Page",
+                    content="This is an integration test page."
+                ),
+                "append_paragraph_to_page": executor.submit(
+                    tools.append_paragraph_to_page,
+                    page_id=request.cls.test_page_id,
+                    paragraph=f"Integration test paragraph content - {unique_suffix()}"
+                ),
+                "get_page_content": executor.submit(tools.get_page_content, request.cls.test_page_id),
+                "search_pages": executor.submit(tools.search_pages, "Integration Test"),
+            }
+        results = {tool_name: future.result() for tool_name, future in futures.items()}
+        # Clean up the created page with the rest of the class, registered before any test asserts on it
+        if isinstance(results["create_page"], dict) and "id" in results["create_page"]:
+            pages_to_archive.append(results["create_page"]["id"])
+        return results
+
+    def test_create_page_real_integration(self, independent_operation_results):
         """Test creating a page with real Notion API - integration test."""
-        result = self.notion_tools.create_page(
-            title="Integration Test Page",
-            content="This is an integration test page."
-        )
+        result = independent_operation_results["create_page"]
         
-        self.assertIsInstance(result, dict, "Expected dict response for successful page creation")
-        self.assertIn("id", result, "Expected 'id' field in successful page creation response")
+        assert isinstance(result, dict), "Expected dict response for successful page creation"
+        assert "id" in result, "Expected 'id' field in successful page creation response"
 
     def test_update_page_title_real_integration(self):
         """Test updating page title with real Notion API - integration test."""
-        new_title = f"Updated Integration Test Title - {datetime.now()}"
+        new_title = f"Updated Integration Test Title - {unique_suffix()}"
         result = self.notion_tools.update_page_title(
             page_id=self.test_page_id,
             new_title=new_title
         )
+        # Restore the shared page's title for the other tests in the class, whichever order they run in
+        restore_result = self.notion_tools.update_page_title(page_id=self.test_page_id, new_title=self.test_page_title)
         
-        self.assertIsInstance(result, str, "Expected string response for page title update")
-        self.assertIn("Successfully updated page title", result, "Expected success message for page title update")
-        self.assertIn(new_title, result, "Expected new title in success message")
+        assert "Successfully updated page title" in restore_result, f"Failed to restore the shared test page title: {restore_result}"
+        assert isinstance(result, str), "Expected string response for page title update"
+        assert "Successfully updated page title" in result, "Expected success message for page title update"
+        assert new_title in result, "Expected new title in success message"
 
-    def test_append_paragraph_to_page_real_integration(self):
+    def test_append_paragraph_to_page_real_integration(self, independent_operation_results):
         """Test appending paragraph with real Notion API - integration test."""
-        paragraph_content = f"Integration test paragraph content - {datetime.now()}"
-        result = self.notion_tools.append_paragraph_to_page(
-            page_id=self.test_page_id,
-            paragraph=paragraph_content
-        )
+        result = independent_operation_results["append_paragraph_to_page"]
         
-        self.assertIsInstance(result, dict, "Expected dict response for successful paragraph append")
-        self.assertIn("results", result, "Expected 'results' field in successful append response")
-        self.assertTrue(len(result["results"]) > 0, "Expected at least one result in append response")
+        assert isinstance(result, dict), "Expected dict response for successful paragraph append"
+        assert "results" in result, "Expected 'results' field in successful append response"
+        assert len(result["results"]) > 0, "Expected at least one result in append response"
 
-    def test_get_page_content_real_integration(self):
+    def test_get_page_content_real_integration(self, independent_operation_results):
         """Test getting page content with real Notion API - integration test."""
-        result = self.notion_tools.get_page_content(self.test_page_id)
+        result = independent_operation_results["get_page_content"]
         
-        self.assertIsInstance(result, str, "Expected string response for page content")
-        self.assertIn("Page content:", result, "Expected page content prefix in response")
-        self.assertIn(self.test_page_title, result, "Expected page title in content response")
+        assert isinstance(result, str), "Expected string response for page content"
+        assert "Page content:" in result, "Expected page content prefix in response"
+        assert self.test_page_title in result, "Expected page title in content response"
 
-    def test_search_pages_real_integration(self):
+    def test_search_pages_real_integration(self, independent_operation_results):
         """Test searching pages with real Notion API - integration test."""
         # Search for our test page
-        result = self.notion_tools.search_pages("Integration Test")
+        result = independent_operation_results["search_pages"]
         
-        self.assertIsInstance(result, str, "Expected string response for search")
-        self.assertTrue(
-            result.startswith("Search results:") or result == "No pages found matching the search query",
+        assert isinstance(result, str), "Expected string response for search"
+        assert result.startswith("Search results:") or result == "No pages found matching the search query", \
             "Expected search results or no results message"
-        )
 
 
-class TestNotionToolsAPICallsIntegration(unittest.TestCase):
+class TestNotionToolsAPICallsIntegration:
     """Integration tests for direct Notion API calls."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Ensure required environment variables are set - fail if missing
-        required_env_vars = ["NOTION_API_KEY", "NOTION_TEST_PAGE_ID"]
-        for var in required_env_vars:
-            if not os.getenv(var):
-                self.fail(f"Required environment variable {var} not set for integration tests")
-        
-        self.notion_headers = {
-            "Authorization": f"Bearer {os.getenv('NOTION_API_KEY')}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28"
-        }
-        self.notion_base_url = "https://api.notion.com/v1"
-
-        # Create Notion tools instance - fail if initialization fails
-        try:
-            tools = get_tools(make_tools_context())
-
-            class Self:
-                def __init__(self, tools):
-                    self.create_page = tools[0]
-                    self.get_page = tools[1]
-                    self.update_page_properties = tools[2]
-                    self.append_paragraph_to_page = tools[3]
-                    self.append_block_children = tools[4]
-                    self.get_block_children = tools[5]
-                    self.create_database = tools[6]
-                    self.get_database = tools[7]
-                    self.update_database_schema = tools[8]
-                    self.query_database = tools[9]
-                    self.get_page_content = tools[10]
-                    self.search_pages = tools[11]
-                    self.update_page_title = tools[12]
-                    self.resolve_page_id = tools[13]
-
-            self.notion_tools = Self(tools)
-        except Exception as e:
-            self.fail(f"Failed to initialize NotionTools. This is a required prerequisite: {e}")
+    @pytest.fixture(scope="class", autouse=True)
+    def notion_environment(self, request, notion_tools, pages_to_archive):
+        """Set up test environment once for the class."""
+        request.cls.notion_tools = notion_tools
+        request.cls.pages_to_archive = pages_to_archive
 
     def test_notion_api_authentication_integration(self):
         """Test Notion API authentication - integration test."""
         # Test authentication by making a simple API call
         try:
-            import requests
-            
-            response = requests.get(
-                f"{self.notion_base_url}/users/me",
-                headers=self.notion_headers,
-                timeout=10
-            )
+            response = NOTION_SESSION.get(f"{NOTION_API_URL}/users/me", timeout=10)
             
             # Should be authenticated successfully
-            self.assertEqual(response.status_code, 200, "Expected successful authentication")
+            assert response.status_code == 200, "Expected successful authentication"
             response_data = response.json()
-            self.assertIn("object", response_data, "Expected object field in authentication response")
-            self.assertEqual(response_data["object"], "user", "Expected user object type")
+            assert "object" in response_data, "Expected object field in authentication response"
+            assert response_data["object"] == "user", "Expected user object type"
         except Exception as e:
-            self.fail(f"Notion API authentication test failed: {e}")
+            pytest.fail(f"Notion API authentication test failed: {e}")
 
     def test_notion_database_access_integration(self):
         """Test Notion database access - integration test."""
-        test_page_id = os.getenv("NOTION_TEST_PAGE_ID")
-        if test_page_id:
-            try:
-                import requests
-                
-                response = requests.get(
-                    f"{self.notion_base_url}/pages/{test_page_id}",
-                    headers=self.notion_headers,
-                    timeout=10
-                )
-                
-                # Should successfully access the page
-                self.assertEqual(response.status_code, 200, "Expected successful page access")
-                response_data = response.json()
-                self.assertIn("id", response_data, "Expected id field in page response")
-                self.assertIn("properties", response_data, "Expected properties field in page response")
-            except Exception as e:
-                self.fail(f"Notion database access test failed: {e}")
+        # The session-scoped prerequisite check has already failed the test if the page is not configured
+        try:
+            response = NOTION_SESSION.get(f"{NOTION_API_URL}/pages/{REQUIRED_ENVIRONMENT['NOTION_TEST_PAGE_ID']}", timeout=10)
+            
+            # Should successfully access the page
+            assert response.status_code == 200, "Expected successful page access"
+            response_data = response.json()
+            assert "id" in response_data, "Expected id field in page response"
+            assert "properties" in response_data, "Expected properties field in page response"
+        except Exception as e:
+            pytest.fail(f"Notion database access test failed: {e}")
 
     def test_notion_page_operations_real_integration(self):
         """Test complete Notion page operations - integration test."""
@@ -238,167 +222,109 @@ class TestNotionToolsAPICallsIntegration(unittest.TestCase):
         )
         
         # Should get successful dict response
-        self.assertIsInstance(create_result, dict, "Expected dict response for successful page creation")
-        self.assertIn("id", create_result, "Expected id field in created page")
+        assert isinstance(create_result, dict), "Expected dict response for successful page creation"
+        assert "id" in create_result, "Expected id field in created page"
         
         created_page_id = create_result["id"]
-        
-        # Update title using the created page
-        update_result = self.notion_tools.update_page_title(
-            page_id=created_page_id,
-            new_title="Updated Workflow Title"
-        )
+        # Clean up the created page with the rest of the class
+        self.pages_to_archive.append(created_page_id)
+        
+        # Update title using the created page and search for pages concurrently - the search does not depend on the update
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            update_future = executor.submit(
+                self.notion_tools.update_page_title,
+                page_id=created_page_id,
+                new_title="Updated Workflow Title"
+            )
+            search_future = executor.submit(self.notion_tools.search_pages, "Integration Test")
+        update_result, search_result = update_future.result(), search_future.result()
         
         # Should get successful string response
-        self.assertIsInstance(update_result, str, "Expected string response for title update")
-        self.assertIn("Successfully updated page title", update_result, "Expected success message")
-        
-        # Search for pages
-        search_result = self.notion_tools.search_pages("Integration Test")
+        assert isinstance(update_result, str), "Expected string response for title update"
+        assert "Successfully updated page title" in update_result, "Expected success message"
         
         # Should get successful search response
-        self.assertIsInstance(search_result, str, "Expected string response for search")
-        self.assertTrue(
-            search_result.startswith("Search results:") or search_result == "No pages found matching the search query",
+        assert isinstance(search_result, str), "Expected string response for search"
+        assert search_result.startswith("Search results:") or search_result == "No pages found matching the search query", \
             "Expected search results or no results message"
-        )
-        
-        # Clean up the created page
-        try:
-            import requests
-            requests.patch(
-                f"{self.notion_base_url}/pages/{created_page_id}",
-                headers=self.notion_headers,
-                json={"archived": True}
-            )
-        except:
-            pass
 
 
-class TestNotionToolsErrorHandlingIntegration(unittest.TestCase):
+class TestNotionToolsErrorHandlingIntegration:
     """Integration tests for error handling with real Notion API."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Ensure required environment variables are set - fail if missing
-        required_env_vars = ["NOTION_API_KEY", "NOTION_TEST_PAGE_ID"]
-        for var in required_env_vars:
-            if not os.getenv(var):
-                self.fail(f"Required environment variable {var} not set for integration tests")
-        
-        # Create Notion tools instance - fail if initialization fails
-        try:
-            tools = get_tools(make_tools_context())
-
-            class Self:
-                def __init__(self, tools):
-                    self.create_page = tools[0]
-                    self.get_page = tools[1]
-                    self.update_page_properties = tools[2]
-                    self.append_paragraph_to_page = tools[3]
-                    self.append_block_children = tools[4]
-                    self.get_block_children = tools[5]
-                    self.create_database = tools[6]
-                    self.get_database = tools[7]
-                    self.update_database_schema = tools[8]
-                    self.query_database = tools[9]
-                    self.get_page_content = tools[10]
-                    self.search_pages = tools[11]
-                    self.update_page_title = tools[12]
-                    self.resolve_page_id = tools[13]
-
-            self.notion_tools = Self(tools)
-        except Exception as e:
-            self.fail(f"Failed to initialize NotionTools. This is a required prerequisite: {e}")
-
-    def test_notion_invalid_page_id_integration(self):
+    @pytest.fixture(scope="class", autouse=True)
+    def notion_environment(self, request, notion_tools):
+        """Set up test environment once for the class."""
+        request.cls.notion_tools = notion_tools
+
+    @pytest.fixture(scope="class")
+    def invalid_target_results(self, request):
+        """Issue the calls against invalid pages concurrently once per class - each is an independent network-bound Notion call."""
+        tools = request.cls.notion_tools
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                "get_page_content": executor.submit(tools.get_page_content, "invalid-page-id-12345"),
+                "update_page_title": executor.submit(
+                    tools.update_page_title,
+                    page_id="non-existent-page-123",
+                    new_title="This Should Fail"
+                ),
+            }
+        return {tool_name: future.result() for tool_name, future in futures.items()}
+
+    def test_notion_invalid_page_id_integration(self, invalid_target_results):
         """Test operations with invalid page ID - should fail with specific error."""
-        result = self.notion_tools.get_page_content("invalid-page-id-12345")
+        result = invalid_target_results["get_page_content"]
         
         # Should fail with specific Notion API error message
-        self.assertIsInstance(result, str, "Expected string error response")
-        self.assertIn("Error", result, "Expected error message for invalid page ID")
+        assert isinstance(result, str), "Expected string error response"
+        assert "Error" in result, "Expected error message for invalid page ID"
 
     def test_notion_empty_search_query_integration(self):
         """Test search with empty query - should return specific error."""
         result = self.notion_tools.search_pages("")
         
         # Should return specific error for empty query
-        self.assertIsInstance(result, str, "Expected string response for empty query")
-        self.assertEqual(result, "Error: Search query cannot be empty", "Expected specific empty query error message")
+        assert isinstance(result, str), "Expected string response for empty query"
+        assert result == "Error: Search query cannot be empty", "Expected specific empty query error message"
 
-    def test_notion_invalid_request_integration(self):
+    def test_notion_invalid_request_integration(self, invalid_target_results):
         """Test invalid API requests - should fail with specific error."""
         # Try to update non-existent page
-        result = self.notion_tools.update_page_title(
-            page_id="non-existent-page-123",
-            new_title="This Should Fail"
-        )
+        result = invalid_target_results["update_page_title"]
         
         # Should fail with specific API error
-        self.assertIsInstance(result, str, "Expected string error response")
-        self.assertIn("Error", result, "Expected error message for invalid page update")
+        assert isinstance(result, str), "Expected string error response"
+        assert "Error" in result, "Expected error message for invalid page update"
 
 
-class TestNotionToolsDirectAPIIntegration(unittest.TestCase):
+class TestNotionToolsDirectAPIIntegration:
     """Integration tests for direct Notion API operations."""
 
-    def setUp(self):
-        """Set up test environment with real Notion client."""
-        # Ensure required environment variables are set - fail if missing
-        required_env_vars = ["NOTION_API_KEY", "NOTION_TEST_PAGE_ID"]
-        for var in required_env_vars:
-            if not os.getenv(var):
-                self.fail(f"Required environment variable {var} not set for integration tests")
-        
+    @pytest.fixture(scope="class", autouse=True)
+    def notion_test_page(self, request, notion_tools, pages_to_archive):
+        """Set up test environment with real Notion client and one test page shared by the class's tests, which only add to it."""
         try:
-            from notion_client import Client
-            self.notion = Client(auth=os.getenv("NOTION_API_KEY"))
-            self.parent_page_id = os.getenv("NOTION_TEST_PAGE_ID")
-            tools = get_tools(make_tools_context())
-
-            class Self:
-                def __init__(self, tools):
-                    self.create_page = tools[0]
-                    self.get_page = tools[1]
-                    self.update_page_properties = tools[2]
-                    self.append_paragraph_to_page = tools[3]
-                    self.append_block_children = tools[4]
-                    self.get_block_children = tools[5]
-                    self.create_database = tools[6]
-                    self.get_database = tools[7]
-                    self.update_database_schema = tools[8]
-                    self.query_database = tools[9]
-                    self.get_page_content = tools[10]
-                    self.search_pages = tools[11]
-                    self.update_page_title = tools[12]
-                    self.resolve_page_id = tools[13]
-
-            self.notion_tools = Self(tools)
-            self.test_page_title = f"Test Page - {datetime.now()}"
-            self.test_page_id = None
+            request.cls.notion = Client(auth=REQUIRED_ENVIRONMENT["NOTION_API_KEY"])
+            request.cls.parent_page_id = REQUIRED_ENVIRONMENT["NOTION_TEST_PAGE_ID"]
+            request.cls.notion_tools = notion_tools
+            request.cls.pages_to_archive = pages_to_archive
+            request.cls.test_page_title = f"Test Page - {unique_suffix()}"
         except Exception as e:
-            self.fail(f"Failed to initialize Notion client. This is a required prerequisite: {e}")
-
+            pytest.fail(f"Failed to initialize Notion client. This is a required prerequisite: {e}")
+        
         # Create a test page for the tests
-        created_page = self.notion_tools.create_page(
-            title=self.test_page_title,
-            parent_page_id=self.parent_page_id
+        created_page = notion_tools.create_page(
+            title=request.cls.test_page_title,
+            parent_page_id=request.cls.parent_page_id
         )
         # Handle potential string error from Notion client
         if not isinstance(created_page, dict):
-            self.fail(f"Setup failed: Could not create test page. Response: {created_page}")
-
-        self.assertIn("id", created_page)
-        self.test_page_id = created_page["id"]
-
-    def tearDown(self):
-        """Archive the temporary test page."""
-        if self.test_page_id:
-            self.notion.pages.update(
-                page_id=self.test_page_id,
-                archived=True
-            )
+            pytest.fail(f"Setup failed: Could not create test page. Response: {created_page}")
+        
+        assert "id" in created_page
+        request.cls.test_page_id = created_page["id"]
+        pages_to_archive.append(created_page["id"])
 
     def _find_content_in_rich_text(self, block, search_content):
         """Helper function to safely search for content in rich_text arrays."""
@@ -411,7 +337,7 @@ class TestNotionToolsDirectAPIIntegration(unittest.TestCase):
 
     def test_create_page(self):
         """Test creating a new page."""
-        child_page_title = f"Test Child Page - {datetime.now()}"
+        child_page_title = f"Test Child Page - {unique_suffix()}"
         
         # Action
         result = self.notion_tools.create_page(
@@ -421,18 +347,18 @@ class TestNotionToolsDirectAPIIntegration(unittest.TestCase):
         
         # Verification
         if not isinstance(result, dict):
-            self.fail(f"API call failed during test. Response: {result}")
-        self.assertIn("id", result)
-        self.assertEqual(result.get("parent", {}).get("page_id", "").replace("-", ""), self.test_page_id.replace("-", ""))
+            pytest.fail(f"API call failed during test. Response: {result}")
+        assert "id" in result
+        assert result.get("parent", {}).get("page_id", "").replace("-", "") == self.test_page_id.replace("-", "")
         
         # Retrieve the page to confirm title
         page = self.notion.pages.retrieve(page_id=result["id"])
         title_text = page.get("properties", {}).get("title", {}).get("title", [{}])[0].get("text", {}).get("content")
-        self.assertEqual(title_text, child_page_title)
+        assert title_text == child_page_title
 
     def test_append_paragraph_to_page(self):
         """Test appending a paragraph to a page."""
-        content = f"This is a test paragraph added at {datetime.now()}."
+        content = f"This is a test paragraph - {unique_suffix()}."
         
         # Action
         result = self.notion_tools.append_paragraph_to_page(
@@ -442,84 +368,81 @@ class TestNotionToolsDirectAPIIntegration(unittest.TestCase):
         
         # Verification
         if not isinstance(result, dict):
-            self.fail(f"API call failed during test. Response: {result}")
-        self.assertIn("results", result)
-        self.assertTrue(len(result["results"]) > 0)
+            pytest.fail(f"API call failed during test. Response: {result}")
+        assert "results" in result
+        assert len(result["results"]) > 0
         
         # Retrieve children to confirm content
         children = self.notion.blocks.children.list(block_id=self.test_page_id)
-        self.assertTrue(any(
+        assert any(
             self._find_content_in_rich_text(block, content)
             for block in children.get("results", [])
             if "paragraph" in block
-        ))
+        )
 
     def test_create_page_with_env_var(self):
         """Test creating a page using the NOTION_PAGE_ID environment variable."""
-        child_page_title = f"Test Child Page with Env Var - {datetime.now()}"
+        child_page_title = f"Test Child Page with Env Var - {unique_suffix()}"
         
         # Action - Call without parent_page_id to test env var usage
         result = self.notion_tools.create_page(title=child_page_title)
+        # Clean up the created page with the rest of the class, registered before any assertion can fail
+        if isinstance(result, dict) and "id" in result:
+            self.pages_to_archive.append(result["id"])
         
         # Verification
         if not isinstance(result, dict):
-            self.fail(f"API call failed during test. Response: {result}")
-        self.assertIn("id", result)
+            pytest.fail(f"API call failed during test. Response: {result}")
+        assert "id" in result
         
         # The parent should be the env var NOTION_PAGE_ID
         expected_parent = self.parent_page_id.replace("-", "")
         actual_parent = result.get("parent", {}).get("page_id", "").replace("-", "")
-        self.assertEqual(actual_parent, expected_parent)
+        assert actual_parent == expected_parent
         
         # Retrieve the page to confirm title
         page = self.notion.pages.retrieve(page_id=result["id"])
         title_text = page.get("properties", {}).get("title", {}).get("title", [{}])[0].get("text", {}).get("content")
-        self.assertEqual(title_text, child_page_title)
-        
-        # Clean up the created page
-        self.notion.pages.update(page_id=result["id"], archived=True)
+        assert title_text == child_page_title
 
     def test_append_paragraph_with_env_var(self):
         """Test appending a paragraph using the NOTION_PAGE_ID environment variable."""
-        content = f"This is a test paragraph using env var - {datetime.now()}."
+        content = f"This is a test paragraph using env var - {unique_suffix()}."
         
         # Action - Call without page_id to test env var usage
         result = self.notion_tools.append_paragraph_to_page(content=content)
         
         # Verification
         if not isinstance(result, dict):
-            self.fail(f"API call failed during test. Response: {result}")
-        self.assertIn("results", result)
-        self.assertTrue(len(result["results"]) > 0)
+            pytest.fail(f"API call failed during test. Response: {result}")
+        assert "results" in result
+        assert len(result["results"]) > 0
         
         # Retrieve children from the env var page to confirm content
         children = self.notion.blocks.children.list(block_id=self.parent_page_id)
-        self.assertTrue(any(
+        assert any(
             self._find_content_in_rich_text(block, content)
             for block in children.get("results", [])
             if "paragraph" in block
-        ))
+        )
 
     def test_append_paragraph_with_blank_page_id(self):
         """Test that blank page_id is treated as None and uses env var."""
-        content = f"This is a test with blank page_id - {datetime.now()}."
+        content = f"This is a test with blank page_id - {unique_suffix()}."
         
         # Action - Call with empty string page_id to test blank handling
         result = self.notion_tools.append_paragraph_to_page(content=content, page_id="")
         
         # Verification
         if not isinstance(result, dict):
-            self.fail(f"API call failed during test. Response: {result}")
-        self.assertIn("results", result)
-        self.assertTrue(len(result["results"]) > 0)
+            pytest.fail(f"API call failed during test. Response: {result}")
+        assert "results" in result
+        assert len(result["results"]) > 0
         
         # Retrieve children from the env var page to confirm content
         children = self.notion.blocks.children.list(block_id=self.parent_page_id)
-        self.assertTrue(any(
+        assert any(
             self._find_content_in_rich_text(block, content)
             for block in children.get("results", [])
             if "paragraph" in block
-        ))
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+        )
@@ -1,53 +1,49 @@
 #!/usr/bin/env python3
 """
-Integration tests for web_tools using example.com
+Integration tests for web_tools using a localhost server for the example.com page
 """
 
+import functools
 import os
-import shutil
-import tempfile
-import unittest
+import threading
+import pytest
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 from tools.web_tools import get_tools
-from tools.context import ToolsContext
+from tools.testing_support import make_tools_context
 
 
-def make_tools_context(tmp_path):
-    return ToolsContext(
-        role_repository=None,
-        self_worker_name=None,
-        agent_work_dir=str(tmp_path),
-        is_integration_test=True,
-    )
+@pytest.fixture(scope="module")
+def example_page_url():
+    """Serve the example page over real HTTP on localhost, so requests need no DNS, TLS or internet round trip."""
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=os.path.join(os.path.dirname(__file__), "testdata"))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    # A short poll interval lets shutdown return promptly at teardown instead of waiting out the default half second
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/example.html"
+    server.shutdown()
+    server.server_close()
 
 
-class TestWebTools(unittest.TestCase):
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp(prefix="web_tools_test_")
-        tools = get_tools(make_tools_context(self.test_dir))
+@pytest.fixture(scope="module")
+def tools_ctx(tmp_path_factory):
+    """One context for the module - web_request never writes to the agent work dir."""
+    return make_tools_context(tmp_path_factory.mktemp("web_tools_test_"))
 
-        class Self:
-            def __init__(self, tools):
-                self.web_request = tools[0]
 
-        self.web_tools = Self(tools)
+@pytest.fixture(scope="module")
+def web_request(tools_ctx):
+    return get_tools(tools_ctx)[0]
 
-    def tearDown(self):
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
 
-    def test_web_request_example_com(self):
-        result = self.web_tools.web_request("https://example.com")
-        self.assertIsInstance(result, str)
-        self.assertIn("Example Domain", result)
-
-    def test_web_request_invalid_url(self):
-        result = self.web_tools.web_request("http://nonexistent.invalid")
-        self.assertIsInstance(result, str)
-        self.assertTrue(result.startswith("Error:"))
-
-
-if __name__ == "__main__":
-    unittest.main()
+def test_web_request_example_page(web_request, example_page_url):
+    result = web_request(example_page_url)
+    assert isinstance(result, str)
+    assert "Example Domain" in result
 
 
+def test_web_request_invalid_url(web_request):
+    # Nothing listens on port 1, so the connection is refused at once instead of waiting on DNS
+    result = web_request("http://127.0.0.1:1/", timeout_seconds=2)
+    assert isinstance(result, str)
+    assert result.startswith("Error:")
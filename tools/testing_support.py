@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Testing Support Module
+
+Shared helpers for the tool integration tests.
+"""
+
+from typing import Any, Optional
+
+from tools.context import ToolsContext
+
+
+def make_tools_context(agent_work_dir, *, browser: Optional[Any] = None) -> ToolsContext:
+    """Build a standalone integration-test ToolsContext, optionally sharing a launched browser."""
+    return ToolsContext(
+        role_repository=None,
+        self_worker_name=None,
+        agent_work_dir=str(agent_work_dir),
+        is_integration_test=True,
+        browser=browser
+    )
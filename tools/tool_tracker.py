@@ -15,6 +15,10 @@ logger = get_logger("tools:tracker", __name__)
 # Global metrics tracker instance
 _metrics_tracker: Optional[Any] = None
 
+# Tools report failures by returning a string with this prefix
+ERROR_RESULT_PREFIX = "Error:"
+ERROR_RESULT_PREFIX_LENGTH = len(ERROR_RESULT_PREFIX)
+
 # Context variable to track the current executing agent
 current_agent_context: ContextVar[Optional[str]] = ContextVar('current_agent', default=None)
 
@@ -42,13 +46,25 @@ def track_tool_call(tool_name: str, function_name: str):
         function_name: Name of the function being called
     """
     def decorator(func: Callable) -> Callable:
+        # Bound once here rather than resolved on every call; only read when a tracker is recording
+        get_agent = current_agent_context.get
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            # Nothing to record without a tracker, so call straight through - read per call as main sets the tracker after tools are wrapped
+            tracker = _metrics_tracker
+            if tracker is None:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Tool call failed: {tool_name}.{function_name} - {e}")
+                    raise
+            
             success = True
             try:
                 result = func(*args, **kwargs)
                 # Check if result indicates an error
-                if isinstance(result, str) and result.startswith("Error:"):
+                if type(result) is str and result[:ERROR_RESULT_PREFIX_LENGTH] == ERROR_RESULT_PREFIX:
                     success = False
                 return result
             except Exception as e:
@@ -56,20 +72,20 @@ def track_tool_call(tool_name: str, function_name: str):
                 logger.error(f"Tool call failed: {tool_name}.{function_name} - {e}")
                 raise
             finally:
-                # Record the tool call if metrics tracker is available
-                if _metrics_tracker is not None:
-                    try:
-                        _metrics_tracker.record_tool_call(tool_name, function_name, success)
-                        # Also update the current agent's tool call count if available
-                        current_agent = get_current_agent()
-                        if current_agent:
-                            _metrics_tracker.record_agent_tool_call(current_agent)
-                    except Exception as e:
-                        logger.error(f"Failed to record tool call metrics: {e}")
+                # Record the tool call on the tracker read at the start of the call
+                try:
+                    tracker.record_tool_call(tool_name, function_name, success)
+                    # Also update the current agent's tool call count if available
+                    current_agent = get_agent()
+                    if current_agent:
+                        tracker.record_agent_tool_call(current_agent)
+                except Exception as e:
+                    logger.error(f"Failed to record tool call metrics: {e}")
         
         return wrapper
     return decorator
 
+@functools.lru_cache(maxsize=64)
 def get_tool_name_from_module(module_path: str) -> str:
     """
     Extract tool name from module path.
@@ -80,9 +96,7 @@ def get_tool_name_from_module(module_path: str) -> str:
     Returns:
         str: Tool name (e.g., 'file_tools')
     """
-    if '.' in module_path:
-        return module_path.split('.')[-1]
-    return module_path
+    return module_path.rpartition('.')[2]
 
 def create_tracked_tools_dict(tools_dict: Dict[str, Callable], tool_name: str) -> Dict[str, Callable]:
     """
@@ -7,9 +7,12 @@ Currently includes a simple curl-like HTTP request function.
 """
 
 from typing import Optional, Dict
+import atexit
+import functools
 import json
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from logger.log_wrapper import get_logger
 from tools.context import ToolsContext
@@ -17,15 +20,20 @@ from tools.context import ToolsContext
 
 logger = get_logger("tool:web", __name__)
 
+WEB_SESSION = requests.Session()
+WEB_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+WEB_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+atexit.register(WEB_SESSION.close)
 
-def get_tools(tools_context: ToolsContext):
-    """Web tools available to agents"""
 
-    def init(self, agent_work_dir: str):
-        self.agent_work_dir = agent_work_dir
+@functools.lru_cache(maxsize=128)
+def _parse_headers(headers_json: str) -> Dict[str, str]:
+    """Parse a headers JSON string, cached as agents tend to resend the same headers on every request."""
+    return json.loads(headers_json)
+
 
-    self = type("Self", (), {})()
-    init(self, tools_context.agent_work_dir)
+def get_tools(tools_context: ToolsContext):
+    """Web tools available to agents"""
 
     def web_request(url: str, method: str = "GET", headers_json: Optional[str] = None, body: Optional[str] = None, timeout_seconds: int = 30) -> str:
         """
@@ -46,18 +54,16 @@ def get_tools(tools_context: ToolsContext):
             headers: Optional[Dict[str, str]] = None
             if headers_json:
                 try:
-                    headers = json.loads(headers_json)
+                    headers = dict(_parse_headers(headers_json))
                 except Exception as e:
                     return f"Error: Invalid headers JSON - {e}"
 
             logger.info(f"HTTP {method} {url}")
-            response = requests.request(method=method.upper(), url=url, headers=headers, data=body, timeout=timeout_seconds)
-            # Raise for HTTP error codes to surface issues clearly
-            try:
-                response.raise_for_status()
-            except Exception as e:
+            response = WEB_SESSION.request(method=method.upper(), url=url, headers=headers, data=body, timeout=timeout_seconds)
+            response.encoding = response.encoding or "utf-8"
+            if response.status_code >= 400:
                 # Still return the body (often useful for debugging) but signal error
-                return f"Error: HTTP {response.status_code} - {e}\n{response.text}"
+                return f"Error: HTTP {response.status_code} - {response.reason} for url: {response.url}\n{response.text}"
             return response.text
         except requests.Timeout:
             return "Error: Request timed out"